@@ -1,13 +1,12 @@
 # chs_backend/alembic/env.py
 
 from logging.config import fileConfig
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine # Ensure create_async_engine is here
-from sqlalchemy import pool # You might not need this if not used elsewhere for pool config
+from sqlalchemy import create_engine, pool
+from sqlalchemy.engine import make_url
 # from sqlalchemy import engine_from_config # Not typically used with async engines directly for URL
 from alembic import context
 
 import os
-from dotenv import load_dotenv # Used here to load .env for local Alembic commands
 # from sqlalchemy.engine import url as sa_url # Not needed for direct string URL anymore
 
 # --- Import your settings and Base ---
@@ -16,6 +15,7 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 # Assuming Base is defined in main.py, or app.models if you moved it
 from app.models import Base # Or from app.models import Base if you put models in app/models.py
+from app.config import get_settings # Reads DATABASE_URL from the environment or .env
 # --- End Import ---
 
 # --- Configure logging from alembic.ini ---
@@ -23,14 +23,17 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# --- Load .env for local Alembic commands ---
-# Ensure the path to your .env file is correct relative to env.py
-load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
-# --- End Load .env ---
-
 # --- Set SQLAlchemy URL in Alembic config ---
-# Use the DATABASE_URL loaded via your settings
-config.set_main_option("sqlalchemy.url", os.getenv("DATABASE_URL"))
+# Use the DATABASE_URL loaded via your settings (same .env as the app), but with
+# the sync psycopg2 driver: migrations are blocking DDL and gain nothing from asyncio
+MIGRATION_URL = make_url(get_settings().DATABASE_URL).set(
+    drivername="postgresql+psycopg2"
+)
+# configparser treats % as interpolation, so escape it (e.g. in passwords)
+config.set_main_option(
+    "sqlalchemy.url",
+    MIGRATION_URL.render_as_string(hide_password=False).replace("%", "%%"),
+)
 
 # --- Point Alembic to your Base.metadata ---
 target_metadata = Base.metadata
@@ -62,27 +65,17 @@ def do_run_migrations(connection) -> None:
         context.run_migrations()
 
 
-async def run_migrations_online() -> None:
+def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
-    # --- CRUCIAL CHANGE HERE: SIMPLIFY connectable creation ---
-    # Pass the DATABASE_URL string directly to create_async_engine
-    connectable = create_async_engine(
-        os.getenv("DATABASE_URL"),
-        # Optionally, add async_fallback=True if you encounter sync/async connection issues
-        # during migration generation (though usually not needed if env.py is correct)
-        # async_fallback=True
-    )
-    # --- END CRUCIAL CHANGE ---
+    connectable = create_engine(MIGRATION_URL, poolclass=pool.NullPool)
 
-    async with connectable.connect() as connection:
-        await connection.run_sync(do_run_migrations)
+    with connectable.connect() as connection:
+        do_run_migrations(connection)
 
-    await connectable.dispose()
+    connectable.dispose()
 
 
 if context.is_offline_mode():
     run_migrations_offline()
 else:
-    # Ensure asyncio is imported and used to run the async function
-    import asyncio
-    asyncio.run(run_migrations_online())
\ No newline at end of file
+    run_migrations_online()
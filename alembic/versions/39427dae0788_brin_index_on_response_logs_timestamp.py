@@ -0,0 +1,39 @@
+"""BRIN index on response_logs.timestamp
+
+Revision ID: 39427dae0788
+Revises: e95bbaafb17a
+Create Date: 2026-10-14 09:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '39427dae0788'
+down_revision: Union[str, None] = 'e95bbaafb17a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The primary key already has a unique index; ix_response_logs_id duplicated it
+    op.drop_index(op.f('ix_response_logs_id'), table_name='response_logs')
+    # Logs are append-only and read by recency, which suits a BRIN index
+    op.create_index(
+        'response_logs_timestamp_brin',
+        'response_logs',
+        ['timestamp'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('response_logs_timestamp_brin', table_name='response_logs', postgresql_using='brin')
+    op.create_index(op.f('ix_response_logs_id'), 'response_logs', ['id'], unique=False)
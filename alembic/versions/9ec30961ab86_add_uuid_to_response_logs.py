@@ -0,0 +1,31 @@
+"""Add uuid to response_logs
+
+Revision ID: 9ec30961ab86
+Revises: 39427dae0788
+Create Date: 2026-10-14 10:03:17.204882
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9ec30961ab86'
+down_revision: Union[str, None] = '39427dae0788'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # server_default backfills existing rows; new rows get their uuid from the app
+    op.add_column('response_logs', sa.Column('uuid', sa.Uuid(), server_default=sa.text('gen_random_uuid()'), nullable=False))
+    op.create_index(op.f('ix_response_logs_uuid'), 'response_logs', ['uuid'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_response_logs_uuid'), table_name='response_logs')
+    op.drop_column('response_logs', 'uuid')
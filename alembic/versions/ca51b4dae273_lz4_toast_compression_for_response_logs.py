@@ -0,0 +1,36 @@
+"""lz4 TOAST compression for response_logs
+
+Revision ID: ca51b4dae273
+Revises: 9ec30961ab86
+Create Date: 2026-10-14 11:26:05.730914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ca51b4dae273'
+down_revision: Union[str, None] = '9ec30961ab86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Large text columns; lz4 needs PostgreSQL 14+ and only applies to newly written values
+COMPRESSED_COLUMNS = ('user_prompt', 'normal_response', 'chs_response')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Move long values out of line (and compress them) as soon as a row passes 128 bytes
+    op.execute('ALTER TABLE response_logs SET (toast_tuple_target = 128)')
+    for column in COMPRESSED_COLUMNS:
+        op.execute(f'ALTER TABLE response_logs ALTER COLUMN {column} SET COMPRESSION lz4')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in COMPRESSED_COLUMNS:
+        op.execute(f'ALTER TABLE response_logs ALTER COLUMN {column} SET COMPRESSION DEFAULT')
+    op.execute('ALTER TABLE response_logs RESET (toast_tuple_target)')
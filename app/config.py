@@ -0,0 +1,21 @@
+from functools import lru_cache
+from pathlib import Path
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
+
+
+class Settings(BaseSettings):
+    # Real environment variables win over values from .env
+    model_config = SettingsConfigDict(env_file=ENV_FILE, extra="ignore")
+
+    DATABASE_URL: str
+    # Optional so alembic can run without it; /config_test reports when it's missing
+    CLAUDE_KEY: str = ""
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Parse the environment / .env once per process."""
+    return Settings()
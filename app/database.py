@@ -1,16 +1,43 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
-import os
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
-load_dotenv()
-DATABASE_URL = os.getenv("DATABASE_URL")
+from app.config import get_settings
 
-engine = create_async_engine(DATABASE_URL)
-async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+# Always talk to PostgreSQL through asyncpg, whatever driver the URL names
+DATABASE_URL = make_url(get_settings().DATABASE_URL).set(
+    drivername="postgresql+asyncpg"
+)
+
+# Explicit pool sizing: the defaults (5 + 10 overflow) run out quickly under
+# concurrent requests. pre_ping/recycle drop connections the server closed.
+# The statement caches keep the few INSERT/UPDATE statements we run prepared
+# per connection, so repeats skip the server-side parse.
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_timeout=10,
+    connect_args={
+        "prepared_statement_cache_size": 500,  # SQLAlchemy's asyncpg adapter
+        "statement_cache_size": 500,  # asyncpg itself
+    },
+)
+# Every write goes through explicit Core statements, so autoflush has nothing to do
+async_session = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
 
 
 # Dependency
 async def get_db():
     async with async_session() as session:
         yield session
+
+
+# Dependency for endpoints that only read: the transaction is READ ONLY, so
+# PostgreSQL rejects accidental writes and the session can run on a replica
+async def get_db_ro():
+    async with async_session() as session:
+        await session.execute(text("SET TRANSACTION READ ONLY"))
+        yield session
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.database import async_session
+from app.models import ResponseLog
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()  # queue sentinel telling the worker to flush and exit
+
+
+class LogBuffer:
+    """
+    Collects ResponseLog rows in memory and writes them in batches.
+
+    A background task drains the queue and inserts everything it has gathered
+    with one executemany + one COMMIT, either once `max_batch` rows are waiting
+    or `max_delay` seconds after the first row of the batch arrived. Rows are
+    only durable after their batch is flushed; anything still queued when the
+    process dies is lost.
+    """
+
+    def __init__(self, max_batch: int = 20, max_delay: float = 0.05):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush whatever is queued and stop the worker."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(_STOP)
+        await self._task
+        self._task = None
+
+    async def put(self, row: Dict[str, Any]) -> None:
+        # async so BackgroundTasks runs it on the event loop: asyncio.Queue is
+        # not safe to touch from the threadpool sync tasks are sent to
+        self._queue.put_nowait(row)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+
+            batch: List[Dict[str, Any]] = [item]
+            deadline = loop.time() + self.max_delay
+            stopping = False
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            async with async_session() as session:
+                await session.execute(insert(ResponseLog), batch)
+                await session.commit()
+        except Exception:
+            # Nothing is waiting on these rows any more; report and move on so
+            # one bad batch doesn't stop the worker.
+            logger.exception("Failed to write %d response log(s)", len(batch))
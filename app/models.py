@@ -1,15 +1,35 @@
+from uuid import uuid4
+
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, Integer, Text, DateTime, func
+from sqlalchemy import Column, Index, Integer, Text, DateTime, Uuid, func, text
 
 Base = declarative_base()
 
 class ResponseLog(Base):
     __tablename__ = "response_logs"
+    __table_args__ = (
+        # Append-only, queried by recency: BRIN is far smaller than a B-tree here
+        Index(
+            "response_logs_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
+    # Assigned by the app so /compare/ can answer before the row is written
+    uuid = Column(
+        Uuid,
+        nullable=False,
+        unique=True,
+        index=True,
+        default=uuid4,
+        server_default=text("gen_random_uuid()"),
+    )
     timestamp = Column(DateTime(timezone=True), server_default=func.now())
     user_prompt = Column(Text, nullable=False)
     normal_response = Column(Text, nullable=False)
     chs_response = Column(Text, nullable=False)
     user_rating = Column(Integer, nullable=True)        # nullable, for future feedback
-    user_feedback = Column(Text, nullable=True)         # nullable, for future feedback
\ No newline at end of file
+    user_feedback = Column(Text, nullable=True)         # nullable, for future feedback
@@ -1,20 +1,20 @@
 import asyncio
-import os
+from typing import Any
+from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import update
 
-from pydantic import BaseModel
 import httpx
-from dotenv import load_dotenv
+import orjson
 
+from app.config import get_settings
 from app.database import get_db
 from app.models import ResponseLog
-from app.schemas import FeedbackIn
+from app.schemas import CompareRequest, FeedbackIn
 from app.utils import parse_llm_response_to_json
 
-load_dotenv()
 CHS_ATLAS_SYSTEM_PROMPT = """
 You are an emotionally-intelligent AI assistant. Your primary goal is to provide genuinely human, empathetic, and helpful responses to users. For your internal analysis ONLY, you will use the Coordinate Heart System (CHS) described below. This internal analysis helps you choose the best response strategy but should NOT be directly exposed to the user in clinical or technical terms.
 
@@ -169,96 +169,155 @@ This structure is mandatory for your response. If you do not follow it exactly,
 
 router = APIRouter()
 CLAUDE_URL = "https://api.anthropic.com/v1/messages"
+CLAUDE_MODELS_URL = "https://api.anthropic.com/v1/models"  # cheap GET for warm-up
 CLAUDE_MODEL = "claude-sonnet-4-20250514"  # Or sonnet/haiku
 
+# Built once at import; identical for every request
+HEADERS = {
+    "x-api-key": get_settings().CLAUDE_KEY,
+    "anthropic-version": "2023-06-01",
+    "content-type": "application/json",
+}
+TIMEOUT = httpx.Timeout(30.0, connect=10.0)  # 30s total, 10s connect
+LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
 
-class CompareRequest(BaseModel):
-    prompt: str
-
-
-@router.post("/compare/")
-async def compare(request: CompareRequest, db: AsyncSession = Depends(get_db)):
-    headers = {
-        "x-api-key": os.getenv("CLAUDE_KEY"),
-        "anthropic-version": "2023-06-01",
-        "content-type": "application/json",
-    }
 
-    normal_data = {
-        "model": CLAUDE_MODEL,
-        "max_tokens": 1024,
-        "messages": [{"role": "user", "content": request.prompt}],
-    }
+def request_template(**fields: Any) -> tuple[bytes, bytes]:
+    """
+    Serialize a Claude request body once, split around the user prompt.
 
-    chs_data = {
-        "model": CLAUDE_MODEL,
-        "max_tokens": 1024,
-        "messages": [
-            {
-                "role": "user",
-                "content": f"{CHS_ATLAS_SYSTEM_PROMPT}\n\n{request.prompt}",
-            }
-        ],
-    }
+    Everything except the prompt is constant, so per request the body is just
+    prefix + orjson.dumps(prompt) + suffix.
+    """
+    placeholder = "__USER_PROMPT__"
+    body = orjson.dumps(
+        {
+            "model": CLAUDE_MODEL,
+            "max_tokens": 1024,
+            **fields,
+            "messages": [{"role": "user", "content": placeholder}],
+        }
+    )
+    prefix, suffix = body.split(orjson.dumps(placeholder))
+    return prefix, suffix
+
+
+def build_body(template: tuple[bytes, bytes], prompt: str) -> bytes:
+    prefix, suffix = template
+    return prefix + orjson.dumps(prompt) + suffix
+
+
+NORMAL_TEMPLATE = request_template()
+# The CHS prompt goes in the top-level system field instead of being
+# prepended to the user message. The cache_control breakpoint lets Anthropic
+# reuse the processed prompt across requests instead of re-reading it each time.
+CHS_TEMPLATE = request_template(
+    system=[
+        {
+            "type": "text",
+            "text": CHS_ATLAS_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+)
+
+
+async def post_claude(client: httpx.AsyncClient, body: bytes) -> tuple[int, bytes]:
+    """POST a request body to Claude and return the status and raw response bytes."""
+    # Streamed so the body is accumulated straight into one bytes object rather
+    # than kept on a buffered Response alongside its decoded text
+    async with client.stream("POST", CLAUDE_URL, content=body, headers=HEADERS) as resp:
+        chunks = [chunk async for chunk in resp.aiter_bytes()]
+    return resp.status_code, b"".join(chunks)
+
+
+def decode_response(body: bytes) -> tuple[str, Any]:
+    """Return the body text and its parsed JSON (or the text if it isn't JSON)."""
+    raw = body.decode("utf-8", errors="replace")
+    try:
+        return raw, orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return raw, raw
+
+
+def extract_text(data: Any, status: int) -> str:
+    """Pull the first text block out of an already-decoded Claude response."""
+    if status != 200:
+        return f"API Error {status}: {data}"
+    content = data.get("content") if isinstance(data, dict) else None
+    if (
+        content
+        and isinstance(content, list)
+        and isinstance(content[0], dict)
+        and "text" in content[0]
+    ):
+        return content[0]["text"]
+    return f"Unexpected response format: {data}"
+
+
+def upstream_error(exc: BaseException) -> HTTPException:
+    """Map a failed Claude call to the HTTP error reported for it."""
+    if isinstance(exc, httpx.ReadTimeout):
+        return HTTPException(
+            status_code=504,
+            detail="Request timed out - Claude API took too long to respond",
+        )
+    if isinstance(exc, httpx.ConnectTimeout):
+        return HTTPException(status_code=503, detail="Could not connect to Claude API")
+    return HTTPException(status_code=500, detail=f"Unexpected error: {str(exc)}")
+
+
+def unpack_result(result: tuple[int, bytes] | BaseException) -> tuple[str, str]:
+    """Return (text to log, text to respond with) for one Claude call."""
+    if isinstance(result, BaseException):
+        message = upstream_error(result).detail
+        return message, message
+    status, body = result
+    # Decode the body once; the raw text is logged, the dict feeds the response
+    raw, data = decode_response(body)
+    return raw, extract_text(data, status)
 
-    # Configure timeout settings
-    timeout = httpx.Timeout(30.0, connect=10.0)  # 30s total, 10s connect
 
-    try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            # Make requests with proper error handling
-            try:
-                normal_task = client.post(CLAUDE_URL, json=normal_data, headers=headers)
-                chs_task = client.post(CLAUDE_URL, json=chs_data, headers=headers)
-                normal_resp, chs_resp = await asyncio.gather(normal_task, chs_task)
-            except httpx.ReadTimeout:
-                raise HTTPException(
-                    status_code=504,
-                    detail="Request timed out - Claude API took too long to respond",
-                )
-            except httpx.ConnectTimeout:
-                raise HTTPException(
-                    status_code=503, detail="Could not connect to Claude API"
-                )
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
-
-    def parse_resp(resp):
-        try:
-            if resp.status_code == 200:
-                content = resp.json().get("content")
-                if (
-                    content
-                    and isinstance(content, list)
-                    and len(content) > 0
-                    and "text" in content[0]
-                ):
-                    return content[0]["text"]
-                else:
-                    return f"Unexpected response format: {resp.json()}"
-            else:
-                error_detail = (
-                    resp.json()
-                    if resp.headers.get("content-type") == "application/json"
-                    else resp.text
-                )
-                return f"API Error {resp.status_code}: {error_detail}"
-        except Exception as e:
-            return f"Error parsing response: {str(e)}"
-
-    db_log = ResponseLog(
-        user_prompt=request.prompt,
-        normal_response=normal_resp.text,
-        chs_response=chs_resp.text,
+@router.post("/compare/")
+async def compare(
+    request: CompareRequest, http_request: Request, background_tasks: BackgroundTasks
+):
+    # Shared client created at startup (see main.py), so connections stay warm
+    client: httpx.AsyncClient = http_request.app.state.claude
+
+    # HEADERS already carries content-type: application/json
+    normal_task = post_claude(client, build_body(NORMAL_TEMPLATE, request.prompt))
+    chs_task = post_claude(client, build_body(CHS_TEMPLATE, request.prompt))
+    # return_exceptions: one failed call must not cancel the other (already
+    # billed) one; each result is handled on its own below
+    normal_result, chs_result = await asyncio.gather(
+        normal_task, chs_task, return_exceptions=True
+    )
+    if isinstance(normal_result, BaseException) and isinstance(
+        chs_result, BaseException
+    ):
+        raise upstream_error(normal_result)
+
+    normal_raw, normal_text = unpack_result(normal_result)
+    chs_raw, chs_text = unpack_result(chs_result)
+
+    # The row is handed to the batched writer (see app/insert_buffer.py) only
+    # after the response has been sent; the uuid is assigned here so the
+    # response doesn't depend on the insert.
+    log_id = uuid4()
+    background_tasks.add_task(
+        http_request.app.state.log_buffer.put,
+        {
+            "uuid": log_id,
+            "user_prompt": request.prompt,
+            "normal_response": normal_raw,
+            "chs_response": chs_raw,
+        },
     )
-    db.add(db_log)
-    await db.commit()
-    await db.refresh(db_log)
     return {
-        "log_id": db_log.id,
-        "normal_response": parse_resp(normal_resp),
-        "chs_response": parse_llm_response_to_json(parse_resp(chs_resp)),
+        "log_id": log_id,
+        "normal_response": normal_text,
+        "chs_response": parse_llm_response_to_json(chs_text),
     }
     # return {
     #     "log_id": 22,
@@ -292,26 +351,23 @@ async def leave_feedback(feedback: FeedbackIn, db: AsyncSession = Depends(get_db
     """
     Allows a user to leave feedback and a rating for a specific log entry.
     """
-    # 1. Asynchronously fetch the ResponseLog entry
-    # Use `select` from sqlalchemy and `db.execute` with `scalar_one_or_none()`
-    # to ensure proper async database interaction.
-    db_log = await db.execute(
-        select(ResponseLog).filter(ResponseLog.id == feedback.log_id)
+    # 1. Update the row in place and get its key back in the same statement:
+    # one round-trip instead of SELECT + UPDATE + refresh SELECT.
+    result = await db.execute(
+        update(ResponseLog)
+        .where(ResponseLog.uuid == feedback.log_id)
+        .values(
+            user_rating=feedback.user_rating,
+            user_feedback=feedback.user_feedback,
+        )
+        .returning(ResponseLog.uuid)
     )
-    db_log = db_log.scalar_one_or_none()
+    log_id = result.scalar_one_or_none()
 
-    if not db_log:
+    if log_id is None:
         raise HTTPException(status_code=404, detail="Log not found")
 
-    # 2. Update the log entry with user feedback
-    db_log.user_rating = feedback.user_rating
-    db_log.user_feedback = feedback.user_feedback
-
-    # 3. Commit the changes to the database
-    # These are already awaited, which is correct for AsyncSession.
+    # 2. Commit the change
     await db.commit()
 
-    # 4. Refresh the object to ensure it reflects the latest state from the DB
-    await db.refresh(db_log)
-
-    return {"status": "success", "log_id": db_log.id}
+    return {"status": "success", "log_id": log_id}
@@ -1,7 +1,19 @@
-from pydantic import BaseModel
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class CompareRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    # Capped so an oversized prompt is rejected before any Claude call
+    prompt: Annotated[str, Field(min_length=1, max_length=8192)]
 
 
 class FeedbackIn(BaseModel):
-    log_id: int
-    user_rating: int
-    user_feedback: str | None = None
\ No newline at end of file
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    log_id: UUID
+    user_rating: Annotated[int, Field(ge=1, le=5)]
+    user_feedback: Annotated[str | None, Field(max_length=4096)] = None
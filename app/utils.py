@@ -1,5 +1,9 @@
-import json
+import logging
 import re
+from functools import lru_cache
+from itertools import product
+
+import orjson
 from typing import (
     Dict,
     Any,
@@ -8,52 +12,285 @@ from typing import (
     Union,
 )  # Union can be replaced with | for Python 3.10+
 
-
-def parse_llm_response_to_json(response: str) -> Dict[str, Any]:
+logger = logging.getLogger(__name__)
+
+# Every pattern is compiled once at import instead of on each call.
+
+# --- JSON extraction ---
+# ```json ... ``` or ``` ... ``` fenced block
+_MD_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
+# Largest {...} span (first "{" to last "}")
+_BRACE_RE = re.compile(r"(\{.*\})", re.DOTALL)
+
+# --- fix_common_json_errors ---
+# { key: value } -> { "key": value }
+_UNQUOTED_KEY_RE = re.compile(r'(?<![\'"\w])([a-zA-Z_]\w*)\s*:')
+# 'key': -> "key":
+_SINGLE_KEY_RE = re.compile(r"(?<!\\)'([a-zA-Z_]\w*)'(?=\s*:)")
+# :'value' -> :"value"
+_SINGLE_VAL_RE = re.compile(r":\s*(?<!\\)'([^']*(?:\\.[^']*)*)'")
+# Double-quoted strings (unterminated ones run to the end) and square brackets;
+# brackets inside strings are swallowed by the string token
+_BRACKET_SCAN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"?|[\[\]]', re.DOTALL)
+# Tokens that affect how array elements split: escapes, quoted strings
+# (unterminated ones run to the end), brackets and commas
+_ARRAY_SCAN_RE = re.compile(
+    r"""\\.|"(?:\\.|[^"\\])*"?|'(?:\\.|[^'\\])*'?|[\[\]{},]""", re.DOTALL
+)
+_NUMBER_RE = re.compile(r"-?\d+(\.\d+)?([eE][-+]?\d+)?")
+# Every casing of true/false/null, so membership replaces elem.lower() in [...]
+_BOOL_NULL = frozenset(
+    "".join(chars)
+    for word in ("true", "false", "null")
+    for chars in product(*zip(word, word.upper()))
+)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_MULTI_COMMA_RE = re.compile(r"(,\s*,)+")
+
+# --- extract_partial_data ---
+# Tried in order: double quotes, single quotes, smart double quotes.
+# Values are unrolled as runs of non-quote chars joined by backslash-escaped
+# quotes, so the engine scans runs instead of trying an alternation per char.
+_USER_RESPONSE_RES = (
+    re.compile(r'"user_facing_response"\s*:\s*"([^"]*(?:(?<=\\)"[^"]*)*)"'),
+    re.compile(r"'user_facing_response'\s*:\s*'([^']*(?:(?<=\\)'[^']*)*)'"),
+    re.compile(r'"user_facing_response"\s*:\s*“([^”]*)”'),
+)
+_PRIMARY_EMOTION_RE = re.compile(
+    r'"primaryEmotion"\s*:\s*["“\']([^"”\']*)["”\']', re.IGNORECASE
+)
+_COMPLEX_EMOTION_RE = re.compile(
+    r'"complexEmotion"\s*:\s*["“\']([^"”\']*)["”\']', re.IGNORECASE
+)
+_RESPONSE_STRATEGY_RE = re.compile(
+    r'"responseStrategy"\s*:\s*["“\']([^"”\']*)["”\']', re.IGNORECASE
+)
+_INTENSITY_RE = re.compile(r'"intensity"\s*:\s*([0-9.]+)', re.IGNORECASE)
+_INSTABILITY_RE = re.compile(r'"instability"\s*:\s*([0-9.]+)', re.IGNORECASE)
+_COLLAPSE_RISK_RE = re.compile(r'"collapseRisk"\s*:\s*([0-9.]+)', re.IGNORECASE)
+# (target key, pattern) tables iterated by extract_partial_data
+_STRING_FIELDS = (
+    ("primaryEmotion", _PRIMARY_EMOTION_RE),
+    ("complexEmotion", _COMPLEX_EMOTION_RE),
+    ("responseStrategy", _RESPONSE_STRATEGY_RE),
+)
+_FLOAT_FIELDS = (
+    ("intensity", _INTENSITY_RE),
+    ("instability", _INSTABILITY_RE),
+    ("collapseRisk", _COLLAPSE_RISK_RE),
+)
+# "[0.1, 0.2]", "0.1,0.2", ...
+_COORDINATES_RE = re.compile(r'"coordinates"\s*:\s*["\']?\[?([^\]"\']+)\]?["\']?')
+_LIST_FIELD_RES = {
+    field_name: re.compile(
+        rf'"{field_name}"\s*:\s*\[([^\]]*)\]', re.DOTALL | re.IGNORECASE
+    )
+    for field_name in ("keyIndicators", "riskFactors")
+}
+
+
+# --- array fixing (fix_common_json_errors) ---
+def _fix_array_content(array_content: str) -> str:
+    """Fix elements within the content of a JSON array (the text between its brackets)."""
+    # Split on top-level commas. The scanner only stops on tokens that
+    # matter (escapes, quoted strings, brackets, commas), so the
+    # characters in between are skipped in C rather than looped over.
+    elements = []
+    start = 0
+    depth = 0  # Nested objects or arrays within array elements
+    for token in _ARRAY_SCAN_RE.finditer(array_content):
+        char = token.group()[0]
+        if char == "[" or char == "{":
+            depth += 1
+        elif char == "]" or char == "}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            elements.append(array_content[start : token.start()].strip())
+            start = token.end()
+
+    last_element = array_content[start:].strip()
+    if last_element:
+        elements.append(last_element)
+
+    fixed_elements = []
+    for elem in elements:
+        elem = elem.strip()
+        if not elem:
+            continue
+
+        # Nested array or object: keep it, fixing any arrays inside it
+        if (elem[0] == "[" and elem[-1] == "]") or (elem[0] == "{" and elem[-1] == "}"):
+            fixed_elements.append(_rewrite_arrays(elem))
+        # Check if it's already a valid JSON string (double-quoted)
+        elif elem.startswith('"') and elem.endswith('"'):
+            fixed_elements.append(elem)
+        # Check if it's single-quoted, convert to double
+        elif elem.startswith("'") and elem.endswith("'"):
+            inner_content = elem[1:-1].replace(
+                '"', '\\"'
+            )  # Escape internal double quotes
+            fixed_elements.append(f'"{inner_content}"')
+        # Check if it's a number (integer or float)
+        elif _NUMBER_RE.fullmatch(elem):
+            fixed_elements.append(elem)
+        # Check if it's a boolean or null
+        elif elem in _BOOL_NULL:
+            fixed_elements.append(elem.lower())
+        # Otherwise, assume it's an unquoted string that needs double quotes
+        else:
+            # Escape internal double quotes before wrapping
+            escaped_elem = elem.replace('"', '\\"')
+            fixed_elements.append(f'"{escaped_elem}"')
+
+    return f'[{", ".join(fixed_elements)}]'
+
+
+def _rewrite_arrays(json_str: str) -> str:
+    """Run _fix_array_content on each outermost matched [...] in json_str.
+
+    Brackets inside double-quoted strings are ignored. An unclosed "[" and
+    everything after it, or a stray "]", are left as they are.
     """
-    Robust parser for LLM responses that should contain JSON.
-    Handles malformed JSON, missing fields, and various edge cases.
+    parts = []
+    last = 0  # end of the text already copied into parts
+    start = 0  # position of the current outermost "["
+    depth = 0
+    for token in _BRACKET_SCAN_RE.finditer(json_str):
+        char = token.group()
+        if char == "[":
+            if depth == 0:
+                start = token.start()
+            depth += 1
+        elif char == "]" and depth:
+            depth -= 1
+            if depth == 0:
+                parts.append(json_str[last:start])
+                parts.append(_fix_array_content(json_str[start + 1 : token.start()]))
+                last = token.end()
+    parts.append(json_str[last:])
+    return "".join(parts)
+
+
+# --- safe_parse_value ---
+# One parser per expected type; each takes (value, default) with value not None
+def _parse_identity(value: Any, default: Any) -> Any:
+    return value
+
+
+def _parse_str(value: Any, default: Any) -> str:
+    return str(value)
+
+
+def _parse_float(value: Any, default: Any) -> Any:
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return default
+    return float(value)
 
-    Args:
-        response (str): Raw LLM response text
 
-    Returns:
-        Dict[str, Any]: Parsed and validated JSON with default values for missing fields
-    """
+def _parse_int(value: Any, default: Any) -> Any:
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return default
+        return int(float(value))  # Convert to float first for "1.0"
+    return int(value)
+
+
+def _split_list(content: str) -> List[str]:
+    # Simple split, assumes fix_common_json_errors did most of the heavy lifting.
+    # Whitespace is stripped once per item (map runs str.strip in C), then quotes.
+    return [item.strip("\"'") for item in map(str.strip, content.split(",")) if item]
+
+
+def _parse_list(value: Any, default: Any) -> List[Any]:
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        value = value.strip()
+        if value.startswith("[") and value.endswith("]"):
+            try:
+                # Try to parse as a valid JSON array string
+                parsed_list = orjson.loads(value)
+                if isinstance(parsed_list, list):
+                    return parsed_list
+            except orjson.JSONDecodeError:
+                # If orjson.loads fails, it might be like "[item1, item2]" (unquoted)
+                return _split_list(value[1:-1].strip())
+        else:
+            # If it's a comma-separated string not in brackets
+            return _split_list(value)
+    # If it's a single item not fitting other types, wrap in a list
+    return [str(value)] if value else []  # Ensure empty list for empty non-list value
+
+
+_PARSERS = {
+    str: _parse_str,
+    float: _parse_float,
+    int: _parse_int,
+    list: _parse_list,
+}
+
+
+# --- default structure ---
+# Defaults for internal_chs_analysis; copied, never mutated (lists are re-created)
+_DEFAULT_ANALYSIS: Dict[str, Any] = {
+    "primaryEmotion": "Unknown",
+    "complexEmotion": "Unknown",
+    "coordinates": [0.0, 0.0],
+    "intensity": 0.0,
+    "instability": 0.0,
+    "collapseRisk": 0.0,
+    "keyIndicators": [],
+    "responseStrategy": "General Support",
+    "riskFactors": [],
+}
+
+
+def get_default_structure() -> Dict[str, Any]:
+    """Return the expected structure with default values"""
+    # Shallow copy of the template with fresh lists; cheaper than deepcopy
+    return {
+        "internal_chs_analysis": {
+            **_DEFAULT_ANALYSIS,
+            "coordinates": [0.0, 0.0],
+            "keyIndicators": [],
+            "riskFactors": [],
+        },
+        "user_facing_response": "",
+    }
 
-    def get_default_structure() -> Dict[str, Any]:
-        """Return the expected structure with default values"""
-        return {
-            "internal_chs_analysis": {
-                "primaryEmotion": "Unknown",
-                "complexEmotion": "Unknown",
-                "coordinates": [0.0, 0.0],
-                "intensity": 0.0,
-                "instability": 0.0,
-                "collapseRisk": 0.0,
-                "keyIndicators": [],
-                "responseStrategy": "General Support",
-                "riskFactors": [],
-            },
-            "user_facing_response": "",
-        }
+
+def _copy_structure(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a parsed structure so the caller can mutate it (list items are shared)"""
+    analysis = result["internal_chs_analysis"]
+    return {
+        "internal_chs_analysis": {
+            **analysis,
+            "coordinates": list(analysis["coordinates"]),
+            "keyIndicators": list(analysis["keyIndicators"]),
+            "riskFactors": list(analysis["riskFactors"]),
+        },
+        "user_facing_response": result["user_facing_response"],
+    }
+
+
+def _parse_llm_response(response: str) -> Optional[Dict[str, Any]]:
+    """Uncached parse; see parse_llm_response_to_json. None means "use the defaults"."""
 
     def extract_json_from_text(text: str) -> Optional[str]:
         """Extract JSON content from text, handling markdown and various formats"""
-        if not text or not isinstance(text, str):
-            return None
-
         # Try to extract from markdown code block first
-        # Handles ```json ... ``` or ``` ... ```
-        md_match = re.search(
-            r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL | re.IGNORECASE
-        )
-        if md_match:
-            return md_match.group(1).strip()
+        # Handles ```json ... ``` or ``` ... ```; skip the scan when there's no fence
+        if "```" in text:
+            md_match = _MD_JSON_RE.search(text)
+            if md_match:
+                return md_match.group(1).strip()
 
         # If not in markdown, try to find the largest JSON-like block
         # This looks for content starting with { and ending with }
-        brace_match = re.search(r"(\{.*\})", text, re.DOTALL)
+        brace_match = _BRACE_RE.search(text)
         if brace_match:
             return brace_match.group(1).strip()
 
@@ -61,118 +298,35 @@ def parse_llm_response_to_json(response: str) -> Dict[str, Any]:
 
     def fix_common_json_errors(json_str: str) -> str:
         """Fix common JSON formatting issues like unquoted keys/strings and trailing commas."""
-        if not json_str or not isinstance(json_str, str):
-            return ""
-
         json_str = json_str.strip()
 
         # Add quotes around unquoted keys (e.g., { key: value } -> { "key": value })
         # Avoids adding quotes if already quoted or if it's part of a value.
-        json_str = re.sub(r'(?<![\'"\w])([a-zA-Z_]\w*)\s*:', r'"\1":', json_str)
+        # Each pass below is skipped when the character it needs is absent
+        if ":" in json_str:
+            json_str = _UNQUOTED_KEY_RE.sub(r'"\1":', json_str)
 
         # Replace single quotes with double quotes for keys and string values
-        # For keys: 'key': -> "key":
-        json_str = re.sub(r"(?<!\\)'([a-zA-Z_]\w*)'(?=\s*:)", r'"\1"', json_str)
-        # For values: :'value' -> :"value"
-        json_str = re.sub(r":\s*(?<!\\)'([^']*(?:\\.[^']*)*)'", r': "\1"', json_str)
-
-        def fix_array_content(match_obj: re.Match) -> str:
-            """Callback to fix elements within a JSON array string."""
-            array_content = match_obj.group(1)
-            if (
-                array_content is None
-            ):  # Should not happen with the regex, but good practice
-                return match_obj.group(0)
-
-            elements = []
-            current_element = ""
-            in_quotes = False
-            quote_char = ""
-            escape = False
-            depth = 0  # To handle nested structures like objects or arrays within array elements
-
-            for char in array_content:
-                if escape:
-                    current_element += char
-                    escape = False
-                    continue
-
-                if char == "\\":
-                    current_element += char
-                    escape = True
-                    continue
-
-                if in_quotes:
-                    current_element += char
-                    if char == quote_char:
-                        in_quotes = False
-                else:
-                    if char in ('"', "'"):
-                        current_element += char
-                        in_quotes = True
-                        quote_char = char
-                    elif char == "[" or char == "{":
-                        depth += 1
-                        current_element += char
-                    elif char == "]" or char == "}":
-                        depth -= 1
-                        current_element += char
-                    elif char == "," and depth == 0:
-                        elements.append(current_element.strip())
-                        current_element = ""
-                    else:
-                        current_element += char
-
-            if current_element.strip():
-                elements.append(current_element.strip())
-
-            fixed_elements = []
-            for elem in elements:
-                elem = elem.strip()
-                if not elem:
-                    continue
-
-                # Check if it's already a valid JSON string (double-quoted)
-                if elem.startswith('"') and elem.endswith('"'):
-                    fixed_elements.append(elem)
-                # Check if it's single-quoted, convert to double
-                elif elem.startswith("'") and elem.endswith("'"):
-                    inner_content = elem[1:-1].replace(
-                        '"', '\\"'
-                    )  # Escape internal double quotes
-                    fixed_elements.append(f'"{inner_content}"')
-                # Check if it's a number (integer or float)
-                elif re.fullmatch(r"-?\d+(\.\d+)?([eE][-+]?\d+)?", elem):
-                    fixed_elements.append(elem)
-                # Check if it's a boolean or null
-                elif elem.lower() in ["true", "false", "null"]:
-                    fixed_elements.append(elem.lower())
-                # Otherwise, assume it's an unquoted string that needs double quotes
-                else:
-                    # Escape internal double quotes before wrapping
-                    escaped_elem = elem.replace('"', '\\"')
-                    fixed_elements.append(f'"{escaped_elem}"')
-
-            return f'[{", ".join(fixed_elements)}]'
-
-        # Apply fix_array_content to array structures.
-        # This regex tries to find array contents: [...]
-        # It's applied iteratively to handle nested arrays if necessary, though
-        # fix_array_content itself is designed for a flat list of items that might be complex.
+        if "'" in json_str:
+            # For keys: 'key': -> "key":
+            json_str = _SINGLE_KEY_RE.sub(r'"\1"', json_str)
+            # For values: :'value' -> :"value"
+            json_str = _SINGLE_VAL_RE.sub(r': "\1"', json_str)
+
+        # Fix the elements of every array, including arrays nested in arrays
+        # or in objects inside arrays (see _rewrite_arrays).
         try:
-            # A robust regex for capturing array content, including nested structures if they are simple.
-            # The main goal is to capture the content of an array that might contain unquoted strings.
-            json_str = re.sub(
-                r"\[\s*(.*?)\s*\]", fix_array_content, json_str, flags=re.DOTALL
-            )
+            if "[" in json_str:
+                json_str = _rewrite_arrays(json_str)
         except Exception as regex_err:
-            print(f"Warning: Regex substitution for array fixing failed: {regex_err}")
+            logger.warning("Regex substitution for array fixing failed: %s", regex_err)
 
-        # Remove trailing commas before closing curly or square brackets
-        json_str = re.sub(r",\s*([}\]])", r"\1", json_str)
+        if "," in json_str:
+            # Remove trailing commas before closing curly or square brackets
+            json_str = _TRAILING_COMMA_RE.sub(r"\1", json_str)
 
-        # Attempt to fix multiple commas
-        json_str = re.sub(r"(,\s*,)+", ",", json_str)
+            # Attempt to fix multiple commas
+            json_str = _MULTI_COMMA_RE.sub(",", json_str)
 
         return json_str
 
@@ -182,58 +336,9 @@ def parse_llm_response_to_json(response: str) -> Dict[str, Any]:
             return default
 
         try:
-            if expected_type == str:
-                return str(value)
-            elif expected_type == float:
-                if isinstance(value, str):
-                    value = value.strip()
-                    if not value:
-                        return default
-                return float(value)
-            elif expected_type == int:
-                if isinstance(value, str):
-                    value = value.strip()
-                    if not value:
-                        return default
-                    return int(float(value))  # Convert to float first for "1.0"
-                return int(value)
-            elif expected_type == list:
-                if isinstance(value, list):
-                    return value
-                if isinstance(value, str):
-                    value = value.strip()
-                    if value.startswith("[") and value.endswith("]"):
-                        try:
-                            # Try to parse as a valid JSON array string
-                            parsed_list = json.loads(value)
-                            if isinstance(parsed_list, list):
-                                return parsed_list
-                        except json.JSONDecodeError:
-                            # If json.loads fails, it might be like "[item1, item2]" (unquoted)
-                            # The fix_common_json_errors should ideally handle this,
-                            # but as a fallback here:
-                            content = value[1:-1].strip()
-                            if not content:
-                                return []  # Empty list string "[]"
-                            # Simple split, assumes fix_common_json_errors did most of the heavy lifting
-                            return [
-                                item.strip().strip("\"'")
-                                for item in content.split(",")
-                                if item.strip()
-                            ]
-                    else:
-                        # If it's a comma-separated string not in brackets
-                        return [
-                            item.strip().strip("\"'")
-                            for item in value.split(",")
-                            if item.strip()
-                        ]
-                # If it's a single item not fitting other types, wrap in a list
-                return (
-                    [str(value)] if value else []
-                )  # Ensure empty list for empty non-list value
-            return value  # Return as-is if type doesn't match above
-        except (ValueError, TypeError, json.JSONDecodeError):
+            # Types without a parser are returned as-is
+            return _PARSERS.get(expected_type, _parse_identity)(value, default)
+        except (ValueError, TypeError, orjson.JSONDecodeError):
             return default
 
     def validate_and_fix_structure(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -279,18 +384,34 @@ def parse_llm_response_to_json(response: str) -> Dict[str, Any]:
                     pass  # Keep default [0.0, 0.0]
             result["internal_chs_analysis"]["coordinates"] = final_coords
 
-            for field, default_val_type in [
-                ("intensity", float),
-                ("instability", float),
-                ("collapseRisk", float),
-            ]:
-                default_numeric_val = analysis_defaults[field]
-                raw_val = analysis_data.get(field)
-                parsed_val = safe_parse_value(
-                    raw_val, default_val_type, default_numeric_val
-                )
-                # Clamp values between 0.0 and 1.0
-                result["internal_chs_analysis"][field] = max(0.0, min(1.0, parsed_val))
+            # Clamp values between 0.0 and 1.0. Written out instead of
+            # max(0.0, min(1.0, v)) but keeps its results: NaN -> 1.0, -0.0 -> 0.0
+            intensity = safe_parse_value(
+                analysis_data.get("intensity"), float, analysis_defaults["intensity"]
+            )
+            result["internal_chs_analysis"]["intensity"] = (
+                1.0 if not intensity <= 1.0 else intensity if intensity > 0.0 else 0.0
+            )
+            instability = safe_parse_value(
+                analysis_data.get("instability"),
+                float,
+                analysis_defaults["instability"],
+            )
+            result["internal_chs_analysis"]["instability"] = (
+                1.0
+                if not instability <= 1.0
+                else instability if instability > 0.0 else 0.0
+            )
+            collapse_risk = safe_parse_value(
+                analysis_data.get("collapseRisk"),
+                float,
+                analysis_defaults["collapseRisk"],
+            )
+            result["internal_chs_analysis"]["collapseRisk"] = (
+                1.0
+                if not collapse_risk <= 1.0
+                else collapse_risk if collapse_risk > 0.0 else 0.0
+            )
 
             for field in ["keyIndicators", "riskFactors"]:
                 default_list_val = analysis_defaults[field]
@@ -317,33 +438,50 @@ def parse_llm_response_to_json(response: str) -> Dict[str, Any]:
     # --- Main parsing process ---
     parsed_data: Dict[str, Any] = {}
 
+    # The helpers below rely on this check and only ever see a non-empty str
+    if not response or not isinstance(response, str):
+        logger.warning("Empty or non-string response. Using default structure.")
+        return None
+
     try:
+        # Fast path: the whole response is already a clean JSON object
+        stripped = response.lstrip()
+        if stripped[:1] == "{":
+            try:
+                parsed_data = orjson.loads(stripped)
+                logger.debug("Successfully parsed JSON as-is.")
+                return validate_and_fix_structure(parsed_data)
+            except orjson.JSONDecodeError:
+                pass
+
         # Step 1: Extract JSON content from response string
         json_content_str = extract_json_from_text(response)
         if not json_content_str:
-            print(
-                "Warning: No JSON-like content (e.g., {...}) found in response. Using default structure."
+            logger.warning(
+                "No JSON-like content (e.g., {...}) found in response. Using default structure."
             )
-            return get_default_structure()
+            return None
 
         # Step 2: Try to parse the extracted string as-is
         try:
-            parsed_data = json.loads(json_content_str)
-            print("Successfully parsed JSON as-is.")
-        except json.JSONDecodeError as e:
-            print(f"Initial JSON parse failed: {e}. Attempting fixes.")
+            parsed_data = orjson.loads(json_content_str)
+            logger.debug("Successfully parsed JSON as-is.")
+        except orjson.JSONDecodeError as e:
+            logger.debug("Initial JSON parse failed: %s. Attempting fixes.", e)
 
             # Step 3: Try to fix common issues and parse again
             fixed_json_content_str = fix_common_json_errors(json_content_str)
-            print(
-                f"Attempting to parse fixed JSON (first 300 chars): {fixed_json_content_str[:300]}..."
+            logger.debug(
+                "Attempting to parse fixed JSON (first 300 chars): %.300s...",
+                fixed_json_content_str,
             )
             try:
-                parsed_data = json.loads(fixed_json_content_str)
-                print("Successfully parsed JSON after fixes!")
-            except json.JSONDecodeError as e2:
-                print(
-                    f"JSON parse failed even after fixes: {e2}. Falling back to partial regex extraction."
+                parsed_data = orjson.loads(fixed_json_content_str)
+                logger.debug("Successfully parsed JSON after fixes!")
+            except orjson.JSONDecodeError as e2:
+                logger.debug(
+                    "JSON parse failed even after fixes: %s. Falling back to partial regex extraction.",
+                    e2,
                 )
                 # Step 3.5: Fallback to regex-based partial extraction from the original *full* response
                 parsed_data = extract_partial_data(
@@ -353,21 +491,55 @@ def parse_llm_response_to_json(response: str) -> Dict[str, Any]:
                     "user_facing_response"
                 ):
                     # Check if partial extraction yielded anything meaningful
-                    print(
-                        "Warning: Partial extraction yielded no significant data. Using default structure."
+                    logger.warning(
+                        "Partial extraction yielded no significant data. Using default structure."
                     )
-                    return get_default_structure()
-                print("Partial data extracted using regex.")
+                    return None
+                logger.debug("Partial data extracted using regex.")
 
         # Step 4: Validate the obtained data and fill in defaults
         return validate_and_fix_structure(parsed_data)
 
     except Exception as e:  # Catch any other unexpected errors during the process
-        print(
-            f"Critical error in parse_llm_response_to_json: {e}. Using default structure."
+        logger.exception(
+            "Critical error in parse_llm_response_to_json: %s. Using default structure.",
+            e,
         )
         # Consider logging the 'response' and intermediate content for debugging
-        return get_default_structure()
+        return None
+
+
+# Results for recent responses; the cached dicts are only ever handed out as copies
+_PARSE_CACHE_MAX_LEN = 32 * 1024  # longer responses are parsed without caching
+
+
+@lru_cache(maxsize=1024)
+def _parse_cached(response: str) -> Optional[Dict[str, Any]]:
+    return _parse_llm_response(response)
+
+
+def parse_llm_response_to_json(response: str) -> Dict[str, Any]:
+    """
+    Robust parser for LLM responses that should contain JSON.
+    Handles malformed JSON, missing fields, and various edge cases.
+    Repeated responses (up to 32 KB) are served from an LRU cache.
+
+    Args:
+        response (str): Raw LLM response text
+
+    Returns:
+        Dict[str, Any]: Parsed and validated JSON with default values for missing fields
+    """
+    if isinstance(response, str) and len(response) <= _PARSE_CACHE_MAX_LEN:
+        result = _parse_cached(response)
+        if result is not None:
+            return _copy_structure(result)
+    else:
+        result = _parse_llm_response(response)
+        if result is not None:
+            return result
+    # Failures are cached as None; the defaults are only built here
+    return get_default_structure()
 
 
 def extract_partial_data(response: str) -> Dict[str, Any]:
@@ -375,83 +547,39 @@ def extract_partial_data(response: str) -> Dict[str, Any]:
     Last resort: extract partial data using regex when JSON parsing completely fails.
     This function attempts to find known fields in the raw response string.
     """
-    # Initialize with a structure similar to get_default_structure but empty or with regex-found values
+    # Start from the default structure and overwrite with regex-found values
     # This ensures validate_and_fix_structure can work with its output.
-    result: Dict[str, Any] = {
-        "internal_chs_analysis": {
-            "primaryEmotion": "Unknown",
-            "complexEmotion": "Unknown",
-            "coordinates": [0.0, 0.0],
-            "intensity": 0.0,
-            "instability": 0.0,
-            "collapseRisk": 0.0,
-            "keyIndicators": [],
-            "responseStrategy": "General Support",
-            "riskFactors": [],
-        },
-        "user_facing_response": "",
-    }
+    result: Dict[str, Any] = get_default_structure()
 
     if not response or not isinstance(response, str):
         return result  # Return default-like structure if no response
 
     # Extract user_facing_response - flexible with quotes and potential truncation
-    user_response_patterns = [
-        r'"user_facing_response"\s*:\s*"((?:\\"|[^"])*)"',  # Double quotes, handles escaped quotes
-        r"'user_facing_response'\s*:\s*'((?:\\'|[^'])*)'",  # Single quotes, handles escaped quotes
-        r'"user_facing_response"\s*:\s*“((?:\\"|[^”])*)”',  # Smart double quotes
-    ]
-    for pattern in user_response_patterns:
-        match = re.search(pattern, response, re.DOTALL)
+    for pattern in _USER_RESPONSE_RES:
+        match = pattern.search(response)
         if match:
             result["user_facing_response"] = match.group(1).strip()
             break
 
-    # Extract fields from internal_chs_analysis
-    # Using a helper to avoid repetition
-    def regex_extract(field_pattern: str, default_val: Any, val_type: type = str):
-        match = re.search(field_pattern, response, re.IGNORECASE)
-        if match:
-            try:
-                val_str = match.group(1).strip()
-                if val_type == float:
-                    return float(val_str)
-                if val_type == int:
-                    return int(float(val_str))  # for "1.0"
-                return val_str  # default is string
-            except (ValueError, TypeError):
-                return default_val
-        return default_val
-
+    # Extract fields from internal_chs_analysis; fields that don't match or
+    # don't convert keep their default
     analysis_target = result["internal_chs_analysis"]  # type: ignore
 
-    analysis_target["primaryEmotion"] = regex_extract(
-        r'"primaryEmotion"\s*:\s*["“\']([^"”\']*)["”\']',
-        analysis_target["primaryEmotion"],
-    )
-    analysis_target["complexEmotion"] = regex_extract(
-        r'"complexEmotion"\s*:\s*["“\']([^"”\']*)["”\']',
-        analysis_target["complexEmotion"],
-    )
-    analysis_target["responseStrategy"] = regex_extract(
-        r'"responseStrategy"\s*:\s*["“\']([^"”\']*)["”\']',
-        analysis_target["responseStrategy"],
-    )
+    for field_name, pattern in _STRING_FIELDS:
+        match = pattern.search(response)
+        if match:
+            analysis_target[field_name] = match.group(1).strip()
 
-    analysis_target["intensity"] = regex_extract(
-        r'"intensity"\s*:\s*([0-9.]+)', analysis_target["intensity"], float
-    )
-    analysis_target["instability"] = regex_extract(
-        r'"instability"\s*:\s*([0-9.]+)', analysis_target["instability"], float
-    )
-    analysis_target["collapseRisk"] = regex_extract(
-        r'"collapseRisk"\s*:\s*([0-9.]+)', analysis_target["collapseRisk"], float
-    )
+    for field_name, pattern in _FLOAT_FIELDS:
+        match = pattern.search(response)
+        if match:
+            try:
+                analysis_target[field_name] = float(match.group(1))
+            except ValueError:
+                pass  # e.g. "1.2.3"
 
     # Extract coordinates - handle various formats like "[0.1, 0.2]" or "0.1,0.2"
-    coord_match = re.search(
-        r'"coordinates"\s*:\s*["\']?\[?([^\]"\']+)\]?["\']?', response
-    )
+    coord_match = _COORDINATES_RE.search(response)
     if coord_match:
         coords_str = coord_match.group(1)
         try:
@@ -467,8 +595,7 @@ def extract_partial_data(response: str) -> Dict[str, Any]:
     def regex_extract_list(field_name: str) -> List[str]:
         list_items = []
         # Pattern to find the array content, e.g., "keyIndicators": ["item1", "item2"] or unquoted
-        pattern = rf'"{field_name}"\s*:\s*\[([^\]]*)\]'
-        match = re.search(pattern, response, re.DOTALL | re.IGNORECASE)
+        match = _LIST_FIELD_RES[field_name].search(response)
         if match:
             content_str = match.group(1).strip()
             if content_str:
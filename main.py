@@ -1,16 +1,15 @@
-import os
+import asyncio
 
+import httpx
 from fastapi import FastAPI
-from app.routes import router
+from fastapi.responses import ORJSONResponse
+from app.routes import router, CLAUDE_MODELS_URL, HEADERS, LIMITS, TIMEOUT
 from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
-from app.models import Base
-from app.database import engine
+from app.config import get_settings
+from app.insert_buffer import LogBuffer
 
 
-load_dotenv()
-
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.include_router(router)
 origins = ["*"]
 app.add_middleware(
@@ -24,6 +23,27 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def startup():
+    # One Claude client per process: reuses the connection pool and TLS sessions
+    app.state.claude = httpx.AsyncClient(http2=True, timeout=TIMEOUT, limits=LIMITS)
+    app.state.log_buffer = LogBuffer()
+    app.state.log_buffer.start()
+    # Open connections now so the first /compare/ doesn't pay for the handshakes;
+    # results and errors are irrelevant here
+    await asyncio.gather(
+        *(app.state.claude.get(CLAUDE_MODELS_URL, headers=HEADERS) for _ in range(2)),
+        return_exceptions=True,
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    # Flush queued logs before the process exits
+    await app.state.log_buffer.stop()
+    await app.state.claude.aclose()
+
+
 @app.get("/")
 async def read_root():
     """
@@ -31,19 +51,19 @@ async def read_root():
     """
     return {"message": "Hello from FastAPI with PostgreSQL & .env access!"}
 
+# Settings don't change while the process runs, so the masked summary is built once
+_settings = get_settings()
+CONFIG_TEST = {
+    "database_url_prefix": _settings.DATABASE_URL.split('://')[0] + "://...", # Mask sensitive part
+    "claude_key_status": "Loaded" if _settings.CLAUDE_KEY else "Not Loaded",
+    "claude_key_first_chars": _settings.CLAUDE_KEY[:5] + "..." if _settings.CLAUDE_KEY else "N/A"
+}
+
+
 @app.get("/config_test")
 async def get_config_test():
     """
     Endpoint to test if environment variables are loaded correctly.
     Avoid exposing sensitive information directly.
     """
-    return {
-        "database_url_prefix": os.getenv("DATABASE_URL").split('://')[0] + "://...", # Mask sensitive part
-        "claude_key_status": "Loaded" if os.getenv("CLAUDE_KEY") else "Not Loaded",
-        "claude_key_first_chars": os.getenv("CLAUDE_KEY")[:5] + "..." if os.getenv("CLAUDE_KEY") else "N/A"
-    }
-
-@app.get("/migrate")
-async def migrate_endpoint():
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+    return CONFIG_TEST